@@ -6,7 +6,9 @@ from plotly.subplots import make_subplots
 import json
 import numpy as np
 import os
+import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 # Configure page
 st.set_page_config(
@@ -49,6 +51,93 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
+# Component files of the multi-file '課程' layout; only the counts file is required,
+# the others can be derived from it when missing.
+COURSE_DATA_FILES = {
+    'dept_counts': 'department_sdg_counts.json',
+    'dept_percentages': 'department_sdg_percentages.json',
+    'overall_dist': 'overall_sdg_distribution.json',
+    'sdg13_dist': 'specific_SDG13_distribution.json',
+}
+
+
+def read_json_timed(file_path):
+    """讀取單一 JSON 檔案，回傳 (資料, 錯誤, 耗時秒數)；錯誤不會拋出，交由呼叫端處理。"""
+    start = time.perf_counter()
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        error = None
+    except Exception as e:
+        data, error = None, e
+    return data, error, time.perf_counter() - start
+
+
+def derive_overall_distribution(dept_counts):
+    """由各科系計數加總出整體 SDG 分佈 (依次數由高到低排序)。"""
+    sdg_totals = defaultdict(int)
+    for dept in dept_counts:
+        for key, value in dept.items():
+            if key.startswith('SDG') or key == 'NONE':
+                sdg_totals[key] += value
+    return [{"SDG": sdg, "次數": count}
+            for sdg, count in sorted(sdg_totals.items(), key=lambda item: item[1], reverse=True)]
+
+
+def derive_sdg13_distribution(dept_counts):
+    """由各科系計數取出 SDG13 提及數大於 0 的科系 (依數量由高到低排序)。"""
+    sdg13_dist = [{'提及課程數量': dept['科系名稱'], 'count': dept['SDG13']}
+                  for dept in dept_counts if dept.get('SDG13', 0) > 0]
+    return sorted(sdg13_dist, key=lambda item: item['count'], reverse=True)
+
+
+def derive_percentages(dept_counts):
+    """由各科系計數計算各 SDG (含 NONE) 佔該科系總提及數的百分比。"""
+    dept_percentages = []
+    for dept in dept_counts:
+        counts = {key: value for key, value in dept.items() if key != '科系名稱'}
+        total = sum(counts.values())
+        dept_dict = {'科系名稱': dept['科系名稱']}
+        dept_dict.update({key: (value / total * 100 if total > 0 else 0.0) for key, value in counts.items()})
+        dept_percentages.append(dept_dict)
+    return dept_percentages
+
+
+def load_course_folder(data_folder):
+    """平行讀取 '課程' 資料夾中的所有元件檔案。
+
+    回傳 (資料字典, 各檔案耗時, 改為推導的檔案清單)。計數檔為必要檔案，缺少或無法解析時會拋出錯誤；
+    其他檔案缺少或無法解析時則由計數資料推導。
+    """
+    paths = {key: os.path.join(data_folder, file_name) for key, file_name in COURSE_DATA_FILES.items()}
+    with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+        futures = {key: executor.submit(read_json_timed, path) for key, path in paths.items()}
+        results = {key: future.result() for key, future in futures.items()}
+
+    latencies = {COURSE_DATA_FILES[key]: elapsed for key, (_, _, elapsed) in results.items()}
+
+    dept_counts, counts_error, _ = results['dept_counts']
+    if counts_error is not None:
+        raise counts_error
+
+    derivations = {
+        'dept_percentages': derive_percentages,
+        'overall_dist': derive_overall_distribution,
+        'sdg13_dist': derive_sdg13_distribution,
+    }
+    data = {'dept_counts': dept_counts}
+    derived = []
+    for key, derive in derivations.items():
+        loaded, error, _ = results[key]
+        if error is None:
+            data[key] = loaded
+        else:
+            data[key] = derive(dept_counts)
+            derived.append(COURSE_DATA_FILES[key])
+
+    return data, latencies, derived
+
+
 # Load data function
 @st.cache_data
 def load_data(data_type, year):
@@ -104,19 +193,16 @@ def load_data(data_type, year):
         elif data_type == '課程':
             data_folder = os.path.join(root_path, year)
             st.sidebar.info(f"📁 正在嘗試載入資料夾: `{data_folder}`")
-            counts_path = os.path.join(data_folder, 'department_sdg_counts.json')
-            percentages_path = os.path.join(data_folder, 'department_sdg_percentages.json')
-            overall_path = os.path.join(data_folder, 'overall_sdg_distribution.json')
-            sdg13_path = os.path.join(data_folder, 'specific_SDG13_distribution.json')
-
-            with open(counts_path, 'r', encoding='utf-8') as f:
-                dept_counts = json.load(f)
-            with open(percentages_path, 'r', encoding='utf-8') as f:
-                dept_percentages = json.load(f)
-            with open(overall_path, 'r', encoding='utf-8') as f:
-                overall_dist = json.load(f)
-            with open(sdg13_path, 'r', encoding='utf-8') as f:
-                sdg13_dist = json.load(f)
+            course_data, latencies, derived = load_course_folder(data_folder)
+            dept_counts = course_data['dept_counts']
+            dept_percentages = course_data['dept_percentages']
+            overall_dist = course_data['overall_dist']
+            sdg13_dist = course_data['sdg13_dist']
+
+            latency_lines = "\n".join(f"- `{name}`: {elapsed * 1000:.1f} ms" for name, elapsed in latencies.items())
+            st.sidebar.caption(f"⏱️ 各檔案載入時間:\n{latency_lines}")
+            if derived:
+                st.sidebar.info(f"ℹ️ 以下檔案缺少或無法解析，已由科系計數推導: {', '.join(derived)}")
 
         st.sidebar.success(f"✅ {data_type} / {year} 學年度資料檔案載入成功！")
 